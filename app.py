@@ -6,7 +6,7 @@ Build each slide in PPT, show preview, get feedback, move to next
 import streamlit as st
 import os
 from datetime import datetime
-from pptmaker_x import ConversationalPPTAgent, TemplatePPTGenerator
+from pptmaker_x import ConversationalPPTAgent, TemplatePPTGenerator, safe_filename
 
 # Page configuration
 st.set_page_config(
@@ -116,7 +116,7 @@ if st.session_state.step == 'input':
 
             # Create filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_topic = "".join(c if c.isalnum() else "_" for c in topic[:30])
+            safe_topic = safe_filename(topic)
             st.session_state.filename = f"{safe_topic}_{timestamp}"
             st.session_state.ppt_path = f"output/{st.session_state.filename}.pptx"
 
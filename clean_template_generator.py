@@ -10,6 +10,13 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 import os
 
+# 16:9 slide size in inches (every layout is drawn on this grid)
+SLIDE_W = 10
+SLIDE_H = 5.625
+
+# Plain black, shared by every dark overlay instead of rebuilt per shape
+BLACK = RGBColor(0, 0, 0)
+
 class CleanTemplateGenerator:
     """Generates clean professional templates with proper text content"""
 
@@ -140,20 +147,30 @@ class CleanTemplateGenerator:
         self.theme = self.THEMES[theme_key]
         self.theme_key = theme_key
         self.prs = Presentation()
-        self.prs.slide_width = Inches(10)
-        self.prs.slide_height = Inches(5.625)
+        self.prs.slide_width = Inches(SLIDE_W)
+        self.prs.slide_height = Inches(SLIDE_H)
+        # Blank layout used by every template slide (looked up once)
+        self._blank_layout = self.prs.slide_layouts[6]
+        # Build each theme colour once; RGBColor is immutable so shapes can share it
+        self.colors = {k: RGBColor(*v) for k, v in self.theme.items() if isinstance(v, tuple)}
 
     def _rgb(self, key):
-        return RGBColor(*self.theme[key])
+        return self.colors[key]
+
+    def _add_box(self, slide, shape, x, y, w, h, color, border=None, border_width=1):
+        """Add a solid-filled shape; no outline unless a border colour key is given"""
+        box = slide.shapes.add_shape(shape, Inches(x), Inches(y), Inches(w), Inches(h))
+        box.fill.solid()
+        box.fill.fore_color.rgb = color if isinstance(color, RGBColor) else self._rgb(color)
+        if border:
+            box.line.color.rgb = self._rgb(border)
+            box.line.width = Pt(border_width)
+        else:
+            box.line.fill.background()
+        return box
 
     def _add_bg(self, slide, color_key='bg'):
-        bg = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0), Inches(0), Inches(10), Inches(5.625)
-        )
-        bg.fill.solid()
-        bg.fill.fore_color.rgb = self._rgb(color_key)
-        bg.line.fill.background()
+        bg = self._add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, SLIDE_W, SLIDE_H, color_key)
         slide.shapes._spTree.remove(bg._element)
         slide.shapes._spTree.insert(2, bg._element)
 
@@ -173,135 +190,101 @@ class CleanTemplateGenerator:
 
     # Layout 1: Hero Title
     def layout_01(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'primary')
 
-        overlay = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-        overlay.fill.solid()
-        overlay.fill.fore_color.rgb = self._rgb('secondary')
-        overlay.fill.transparency = 0.5
-        overlay.line.fill.background()
+        # Full-slide overlay (opaque, covers the background). Kept as its own
+        # shape: TemplatePPTGenerator fills <p:sp> shapes top to bottom, so
+        # the shape count must match the shipped templates
+        self._add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, SLIDE_W, SLIDE_H, 'secondary')
 
         self._add_text(slide, 1.5, 1.8, 7, 1.5, "Presentation Title", 60, True, 'bg', PP_ALIGN.CENTER, 'heading')
         self._add_text(slide, 2, 3.5, 6, 0.6, "Subtitle or tagline here", 24, False, 'bg', PP_ALIGN.CENTER, 'body')
 
     # Layout 2: Section Divider
     def layout_02(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 1, 2, 8, 1.2, "Section Title", 48, True, 'primary', PP_ALIGN.CENTER, 'heading')
 
-        bar = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(3.5), Inches(3.5), Inches(3), Inches(0.15))
-        bar.fill.solid()
-        bar.fill.fore_color.rgb = self._rgb('accent')
-        bar.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 3.5, 3.5, 3, 0.15, 'accent')
 
     # Layout 3: Content + Visual
     def layout_03(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Content Title", 36, True, 'primary', PP_ALIGN.LEFT, 'heading')
         self._add_text(slide, 0.75, 1.75, 4.5, 3, "Main content goes here\n\nKey point one\nKey point two\nKey point three", 18, False, 'text', PP_ALIGN.LEFT, 'body')
 
-        vis = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(5.75), Inches(1.75), Inches(3.5), Inches(3))
-        vis.fill.solid()
-        vis.fill.fore_color.rgb = self._rgb('bg_alt')
-        vis.line.color.rgb = self._rgb('primary')
-        vis.line.width = Pt(2)
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 5.75, 1.75, 3.5, 3, 'bg_alt', border='primary', border_width=2)
 
     # Layout 4: Feature Cards
     def layout_04(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg_alt')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Key Features", 36, True, 'primary', PP_ALIGN.CENTER, 'heading')
 
         for i in range(3):
             x = 1 + i * 2.7
-            card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(1.5), Inches(2.5), Inches(2.8))
-            card.fill.solid()
-            card.fill.fore_color.rgb = self._rgb('bg')
-            card.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x, 1.5, 2.5, 2.8, 'bg')
 
-            circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(x + 0.95), Inches(1.8), Inches(0.6), Inches(0.6))
-            circle.fill.solid()
-            circle.fill.fore_color.rgb = self._rgb('primary')
-            circle.fill.transparency = 0.2
-            circle.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.OVAL, x + 0.95, 1.8, 0.6, 0.6, 'primary')
 
             self._add_text(slide, x + 0.2, 2.6, 2.1, 0.5, f"Feature {i+1}", 20, True, 'text', PP_ALIGN.CENTER, 'heading')
             self._add_text(slide, x + 0.2, 3.2, 2.1, 0.9, "Description of feature", 14, False, 'text_light', PP_ALIGN.CENTER, 'body')
 
     # Layout 5: Data Chart
     def layout_05(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Data Insights", 36, True, 'primary', PP_ALIGN.LEFT, 'heading')
 
-        chart = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.75), Inches(1.75), Inches(8.5), Inches(3.2))
-        chart.fill.solid()
-        chart.fill.fore_color.rgb = self._rgb('bg_alt')
-        chart.line.color.rgb = self._rgb('primary')
-        chart.line.width = Pt(1)
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 0.75, 1.75, 8.5, 3.2, 'bg_alt', border='primary', border_width=1)
 
     # Layout 6: Quote
     def layout_06(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg_alt')
 
-        card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.5), Inches(1.5), Inches(7), Inches(2.5))
-        card.fill.solid()
-        card.fill.fore_color.rgb = self._rgb('bg')
-        card.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 1.5, 1.5, 7, 2.5, 'bg')
 
         self._add_text(slide, 2, 1.9, 6, 1.5, '"Inspiring quote or key message"', 28, False, 'text', PP_ALIGN.CENTER, 'heading')
         self._add_text(slide, 2, 3.5, 6, 0.4, "- Author Name", 16, False, 'text_light', PP_ALIGN.CENTER, 'body')
 
     # Layout 7: Split Screen
     def layout_07(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
 
-        left = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(5), Inches(5.625))
-        left.fill.solid()
-        left.fill.fore_color.rgb = self._rgb('primary')
-        left.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, SLIDE_W / 2, SLIDE_H, 'primary')
 
-        right = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(5), Inches(0), Inches(5), Inches(5.625))
-        right.fill.solid()
-        right.fill.fore_color.rgb = self._rgb('bg')
-        right.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.RECTANGLE, SLIDE_W / 2, 0, SLIDE_W / 2, SLIDE_H, 'bg')
 
         self._add_text(slide, 0.75, 1.5, 3.5, 2.5, "Left Section\n\nContent here", 20, False, 'bg', PP_ALIGN.LEFT, 'body')
         self._add_text(slide, 5.75, 1.5, 3.5, 2.5, "Right Section\n\nContent here", 20, False, 'text', PP_ALIGN.LEFT, 'body')
 
     # Layout 8: Timeline
     def layout_08(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Timeline", 36, True, 'primary', PP_ALIGN.CENTER, 'heading')
 
-        line = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.5), Inches(3), Inches(7), Inches(0.08))
-        line.fill.solid()
-        line.fill.fore_color.rgb = self._rgb('secondary')
-        line.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 1.5, 3, 7, 0.08, 'secondary')
 
         for i in range(4):
             x = 2 + i * 1.8
-            circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(x - 0.15), Inches(3 - 0.15), Inches(0.3), Inches(0.3))
-            circle.fill.solid()
-            circle.fill.fore_color.rgb = self._rgb('primary')
-            circle.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.OVAL, x - 0.15, 3 - 0.15, 0.3, 0.3, 'primary')
 
             self._add_text(slide, x - 0.6, 2.1, 1.2, 0.4, f"Step {i+1}", 16, True, 'text', PP_ALIGN.CENTER, 'heading')
             self._add_text(slide, x - 0.6, 3.4, 1.2, 0.6, "Description", 12, False, 'text_light', PP_ALIGN.CENTER, 'body')
 
     # Layout 9: Big Number
     def layout_09(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 2, 1.5, 6, 1.8, "95%", 96, True, 'primary', PP_ALIGN.CENTER, 'heading')
@@ -310,47 +293,34 @@ class CleanTemplateGenerator:
 
     # Layout 10: Image Hero
     def layout_10(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
 
-        img = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-        img.fill.solid()
-        img.fill.fore_color.rgb = self._rgb('bg_alt')
-        img.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, SLIDE_W, SLIDE_H, 'bg_alt')
 
-        overlay = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-        overlay.fill.solid()
-        overlay.fill.fore_color.rgb = RGBColor(0, 0, 0)
-        overlay.fill.transparency = 0.4
-        overlay.line.fill.background()
+        # Full-slide overlay (kept as its own shape, see layout 1)
+        self._add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, SLIDE_W, SLIDE_H, BLACK)
 
         self._add_text(slide, 1.5, 2, 7, 1.5, "Hero Message", 48, True, 'bg', PP_ALIGN.CENTER, 'heading')
 
     # Layout 11: Comparison
     def layout_11(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Comparison", 36, True, 'primary', PP_ALIGN.CENTER, 'heading')
 
         for i in range(3):
             x = 1 + i * 2.8
-            card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(1.3), Inches(2.6), Inches(3))
-            card.fill.solid()
-            card.fill.fore_color.rgb = self._rgb('bg_alt')
-            card.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x, 1.3, 2.6, 3, 'bg_alt')
 
-            header = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(1.3), Inches(2.6), Inches(0.5))
-            header.fill.solid()
-            header.fill.fore_color.rgb = self._rgb('primary')
-            header.fill.transparency = 0.15
-            header.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.RECTANGLE, x, 1.3, 2.6, 0.5, 'primary')
 
             self._add_text(slide, x + 0.2, 1.45, 2.2, 0.3, f"Option {i+1}", 18, True, 'primary', PP_ALIGN.CENTER, 'heading')
             self._add_text(slide, x + 0.3, 2.1, 2, 1.9, "Feature A\nFeature B\nFeature C", 14, False, 'text', PP_ALIGN.LEFT, 'body')
 
     # Layout 12: Team Grid
     def layout_12(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Our Team", 36, True, 'primary', PP_ALIGN.CENTER, 'heading')
@@ -358,58 +328,39 @@ class CleanTemplateGenerator:
         positions = [(1.2, 1.5), (5.5, 1.5), (1.2, 3.3), (5.5, 3.3)]
 
         for idx, (x, y) in enumerate(positions):
-            card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(y), Inches(3.5), Inches(1.5))
-            card.fill.solid()
-            card.fill.fore_color.rgb = self._rgb('bg_alt')
-            card.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x, y, 3.5, 1.5, 'bg_alt')
 
-            circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(x + 0.3), Inches(y + 0.35), Inches(0.8), Inches(0.8))
-            circle.fill.solid()
-            circle.fill.fore_color.rgb = self._rgb('accent')
-            circle.fill.transparency = 0.3
-            circle.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.OVAL, x + 0.3, y + 0.35, 0.8, 0.8, 'accent')
 
             self._add_text(slide, x + 1.3, y + 0.4, 2, 0.4, f"Team Member {idx+1}", 18, True, 'text', PP_ALIGN.LEFT, 'heading')
             self._add_text(slide, x + 1.3, y + 0.9, 2, 0.6, "Job Title", 14, False, 'text_light', PP_ALIGN.LEFT, 'body')
 
     # Layout 13: Bullet List
     def layout_13(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Key Points", 36, True, 'primary', PP_ALIGN.LEFT, 'heading')
 
-        card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1.5), Inches(1.5), Inches(7), Inches(3))
-        card.fill.solid()
-        card.fill.fore_color.rgb = self._rgb('bg_alt')
-        card.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 1.5, 1.5, 7, 3, 'bg_alt')
 
         for i in range(4):
             y = 2 + i * 0.6
-            bullet = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2), Inches(y), Inches(0.12), Inches(0.12))
-            bullet.fill.solid()
-            bullet.fill.fore_color.rgb = self._rgb('accent')
-            bullet.line.fill.background()
+            self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 2, y, 0.12, 0.12, 'accent')
 
             self._add_text(slide, 2.3, y - 0.05, 5.9, 0.5, f"Key point {i+1} with detailed information", 18, False, 'text', PP_ALIGN.LEFT, 'body')
 
     # Layout 14: Call to Action
     def layout_14(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'primary')
 
-        overlay = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-        overlay.fill.solid()
-        overlay.fill.fore_color.rgb = self._rgb('secondary')
-        overlay.fill.transparency = 0.6
-        overlay.line.fill.background()
+        # Full-slide overlay (kept as its own shape, see layout 1)
+        self._add_box(slide, MSO_SHAPE.RECTANGLE, 0, 0, SLIDE_W, SLIDE_H, 'secondary')
 
         self._add_text(slide, 1.5, 1.5, 7, 1.2, "Ready to Get Started?", 44, True, 'bg', PP_ALIGN.CENTER, 'heading')
 
-        button = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(3.5), Inches(3.2), Inches(3), Inches(0.6))
-        button.fill.solid()
-        button.fill.fore_color.rgb = self._rgb('accent')
-        button.line.fill.background()
+        button = self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 3.5, 3.2, 3, 0.6, 'accent')
 
         tf = button.text_frame
         tf.text = "Get Started"
@@ -423,22 +374,14 @@ class CleanTemplateGenerator:
 
     # Layout 15: Dashboard
     def layout_15(self):
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         self._add_bg(slide, 'bg')
 
         self._add_text(slide, 0.75, 0.75, 8.5, 0.6, "Dashboard Overview", 36, True, 'primary', PP_ALIGN.CENTER, 'heading')
 
-        chart1 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1), Inches(1.5), Inches(4), Inches(3))
-        chart1.fill.solid()
-        chart1.fill.fore_color.rgb = self._rgb('bg_alt')
-        chart1.line.color.rgb = self._rgb('primary')
-        chart1.line.width = Pt(1)
-
-        chart2 = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(5.3), Inches(1.5), Inches(3.7), Inches(3))
-        chart2.fill.solid()
-        chart2.fill.fore_color.rgb = self._rgb('bg_alt')
-        chart2.line.color.rgb = self._rgb('secondary')
-        chart2.line.width = Pt(1)
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 1, 1.5, 4, 3, 'bg_alt', border='primary', border_width=1)
+
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 5.3, 1.5, 3.7, 3, 'bg_alt', border='secondary', border_width=1)
 
     def generate_all(self):
         """Generate all 15 layouts"""
@@ -1,4 +1,4 @@
 # Images package
-from .pexels_fetcher import get_image_for_slide, fetch_image_from_pexels
+from .pexels_fetcher import get_image_for_slide, fetch_image_from_pexels, load_image_stream
 
-__all__ = ['get_image_for_slide', 'fetch_image_from_pexels']
+__all__ = ['get_image_for_slide', 'fetch_image_from_pexels', 'load_image_stream']
@@ -4,12 +4,60 @@ Downloads relevant images from Pexels API for presentation slides
 """
 
 import os
+import io
+import re
+import hashlib
+import logging
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PIL import Image
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Per-image progress goes to the logger (debug), so building a deck doesn't
+# print several lines per slide; warnings and errors still show by default
+log = logging.getLogger(__name__)
+
+# Common words removed from slide titles before searching (set for O(1) lookups)
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "can", "about", "into", "through",
+    "during", "before", "after", "above", "below", "between", "under",
+    "what", "why", "how", "when", "where", "who", "which", "this", "that",
+    "these", "those", "introduction", "overview", "conclusion", "summary"
+})
+
+# Words in a slide title (compiled once, reused for every slide)
+WORD_RE = re.compile(r"[\w']+")
+
+# Runs of punctuation/whitespace, collapsed when normalizing a search query
+NON_WORD_RE = re.compile(r"\W+")
+
+# One HTTP session for every Pexels call: connections (and their TLS
+# handshakes) are kept alive and reused across downloads
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+))
+
+# Slide area an image can cover (16:9 decks, 10 x 5.625 in) and the pixel
+# density kept for it: enough for full-screen HiDPI projection, no more
+SLIDE_WIDTH_IN = 10
+SLIDE_HEIGHT_IN = 5.625
+IMAGE_DPI = 160
+
+# Largest image kept when embedding: the whole slide at IMAGE_DPI (1600 x 900)
+MAX_IMAGE_SIZE = (int(SLIDE_WIDTH_IN * IMAGE_DPI), int(SLIDE_HEIGHT_IN * IMAGE_DPI))
+JPEG_QUALITY = 82
+
 
 def fetch_image_from_pexels(search_query, save_path, orientation="landscape"):
     """
@@ -29,7 +77,7 @@ def fetch_image_from_pexels(search_query, save_path, orientation="landscape"):
     api_key = os.getenv('PEXELS_API_KEY')
 
     if not api_key:
-        print("Warning: PEXELS_API_KEY not found in .env file")
+        log.warning("PEXELS_API_KEY not found in .env file")
         return None
 
     # Pexels API endpoint
@@ -50,8 +98,8 @@ def fetch_image_from_pexels(search_query, save_path, orientation="landscape"):
 
     try:
         # Make API request
-        print(f"Searching Pexels for: {search_query}")
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        log.debug("Searching Pexels for: %s", search_query)
+        response = _SESSION.get(url, headers=headers, params=params, timeout=(3, 10))
         response.raise_for_status()
 
         data = response.json()
@@ -61,62 +109,189 @@ def fetch_image_from_pexels(search_query, save_path, orientation="landscape"):
             photo = data['photos'][0]
             image_url = photo['src']['large']  # Get large version
 
-            # Download the image
-            print(f"Downloading image from: {image_url}")
-            img_response = requests.get(image_url, timeout=15)
-            img_response.raise_for_status()
+            # Different queries often return the same photo; copy the one we
+            # already have to save_path instead of downloading it again
+            photo_id = photo.get('id')
+            image_bytes = _known_photo_bytes(photo_id)
+            if image_bytes is not None:
+                log.debug("Same photo already downloaded, copying to: %s", save_path)
+            else:
+                # Download the image
+                log.debug("Downloading image from: %s", image_url)
+                img_response = _SESSION.get(image_url, timeout=(3, 15))
+                img_response.raise_for_status()
+
+                # Shrink before saving so the .pptx doesn't embed multi-MB photos
+                image_bytes = downscale_image(img_response.content)
 
             # Save the image
             with open(save_path, 'wb') as f:
-                f.write(img_response.content)
+                f.write(image_bytes)
+
+            # Keep the bytes we already have so load_image_stream() can hand
+            # them to add_picture() without reading the file straight back
+            _remember_image_bytes(save_path, image_bytes)
 
-            print(f"Image saved: {save_path}")
+            if photo_id is not None:
+                _downloaded_photos[photo_id] = save_path
+
+            log.debug("Image saved: %s", save_path)
             return save_path
         else:
-            print(f"No images found for: {search_query}")
+            log.info("No images found for: %s", search_query)
             return None
 
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching image: {e}")
+        log.warning("Error fetching image: %s", e)
         return None
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        log.warning("Unexpected error fetching image: %s", e)
         return None
 
 
+def downscale_image(data, max_size=MAX_IMAGE_SIZE, quality=JPEG_QUALITY):
+    """
+    Resizes an image so it fits inside max_size and re-encodes it as JPEG
+
+    Embedded pictures are stored in the .pptx at full resolution, so
+    shrinking them first makes saving faster and the file much smaller.
+
+    Args:
+        data: Original image bytes
+        max_size: (width, height) the image must fit inside
+        quality: JPEG quality (1-95)
+
+    Returns:
+        Smaller JPEG bytes, or the original bytes if they can't be improved
+    """
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.width <= max_size[0] and img.height <= max_size[1] and img.format == "JPEG":
+                return data  # Already small enough
+
+            img.thumbnail(max_size, Image.LANCZOS)
+            if img.mode != "RGB":
+                img = img.convert("RGB")  # JPEG has no alpha channel
+
+            buf = io.BytesIO()
+            img.save(buf, "JPEG", quality=quality, optimize=True)
+    except Exception as e:
+        log.warning("Could not resize image, keeping original: %s", e)
+        return data
+
+    resized = buf.getvalue()
+    return resized if len(resized) < len(data) else data
+
+
 def get_image_for_slide(slide_title, slide_index, output_dir="images/downloads"):
     """
     Gets a relevant image for a slide based on its title
 
+    Images are cached on disk under a hash of the normalized search query,
+    so any slide (in this deck or a later one) that searches for the same
+    keywords reuses the downloaded file instead of calling Pexels again.
+    Queries already resolved in this process are answered from memory.
+
     Args:
         slide_title: Title of the slide
-        slide_index: Index of the slide (for unique filename)
+        slide_index: Index of the slide (kept for compatibility; the cache
+            is keyed by search query)
         output_dir: Directory to save images
 
     Returns:
         Path to downloaded image or None
     """
 
-    # Create downloads directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    # Extract key search terms from slide title
+    # Remove common words and keep important keywords
+    search_query = extract_search_keywords(slide_title)
+
+    # Queries that differ only in case/punctuation share one image
+    norm_query = NON_WORD_RE.sub(" ", search_query.lower()).strip()
 
-    # Create safe filename from slide title
-    safe_title = "".join(c if c.isalnum() else "_" for c in slide_title)
-    safe_title = safe_title[:50]  # Limit length
-    image_filename = f"slide_{slide_index}_{safe_title}.jpg"
-    image_path = os.path.join(output_dir, image_filename)
+    # Already resolved in this process: no filesystem or network access
+    memo_key = (norm_query, output_dir)
+    if memo_key in _query_paths:
+        return _query_paths[memo_key]
+
+    # Cache filename from the normalized search query
+    query_key = hashlib.sha1(norm_query.encode("utf-8")).hexdigest()
+    image_path = os.path.join(output_dir, f"{query_key}.jpg")
 
     # Check if image already exists (avoid re-downloading)
     if os.path.exists(image_path):
-        print(f"Using cached image: {image_path}")
+        log.debug("Using cached image: %s", image_path)
+        _query_paths[memo_key] = image_path
         return image_path
 
-    # Extract key search terms from slide title
-    # Remove common words and keep important keywords
-    search_query = extract_search_keywords(slide_title)
+    # Create downloads directory if it doesn't exist (only needed to download)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Fetch image from Pexels (failures aren't remembered, so they're retried)
+    path = fetch_image_from_pexels(search_query, image_path)
+    if path:
+        _query_paths[memo_key] = path
+    return path
+
+
+# (normalized query, output dir) -> image path, for queries resolved in this process
+_query_paths = {}
+
+# Pexels photo id -> path it was saved to (photos downloaded in this process)
+_downloaded_photos = {}
+
+# Bytes of images downloaded in this process, keyed by saved path
+MAX_DOWNLOADED_IMAGES = 32
+_downloaded_images = {}
+
+
+def _known_photo_bytes(photo_id):
+    """Bytes of a Pexels photo saved earlier in this process, or None"""
+    known_path = _downloaded_photos.get(photo_id) if photo_id is not None else None
+    if not known_path:
+        return None
+    try:
+        return load_image_stream(known_path).getvalue()
+    except OSError:
+        # Deleted since (e.g. by cleanup_old_images): download it again
+        _downloaded_photos.pop(photo_id, None)
+        return None
+
 
-    # Fetch image from Pexels
-    return fetch_image_from_pexels(search_query, image_path)
+def _remember_image_bytes(image_path, data):
+    """Keeps freshly downloaded image bytes in memory (oldest dropped first)"""
+    _downloaded_images.pop(image_path, None)
+    _downloaded_images[image_path] = data
+    if len(_downloaded_images) > MAX_DOWNLOADED_IMAGES:
+        del _downloaded_images[next(iter(_downloaded_images))]
+
+
+@functools.lru_cache(maxsize=32)
+def _read_image_bytes(image_path):
+    """Reads an image file once and keeps its bytes in memory"""
+    with open(image_path, 'rb') as f:
+        return f.read()
+
+
+def load_image_stream(image_path):
+    """
+    Returns an in-memory stream of a downloaded image
+
+    The bytes are cached per path, so the same picture can be passed to
+    slide.shapes.add_picture() on several slides without re-reading the file.
+    Images downloaded in this process are served straight from memory.
+
+    Args:
+        image_path: Path returned by get_image_for_slide
+
+    Returns:
+        io.BytesIO with the image data
+    """
+    data = _downloaded_images.get(image_path)
+    if data is None:
+        data = _read_image_bytes(image_path)
+    return io.BytesIO(data)
 
 
 def extract_search_keywords(slide_title):
@@ -130,22 +305,11 @@ def extract_search_keywords(slide_title):
         Search query string
     """
 
-    # Common words to remove
-    stop_words = [
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
-        "be", "have", "has", "had", "do", "does", "did", "will", "would", "could",
-        "should", "may", "might", "must", "can", "about", "into", "through",
-        "during", "before", "after", "above", "below", "between", "under",
-        "what", "why", "how", "when", "where", "who", "which", "this", "that",
-        "these", "those", "introduction", "overview", "conclusion", "summary"
-    ]
-
-    # Convert to lowercase and split into words
-    words = slide_title.lower().split()
+    # Convert to lowercase and split into words (punctuation dropped)
+    words = WORD_RE.findall(slide_title.lower())
 
     # Remove stop words and keep important keywords
-    keywords = [word for word in words if word not in stop_words and len(word) > 2]
+    keywords = [word for word in words if word not in STOP_WORDS and len(word) > 2]
 
     # Join keywords back together
     if keywords:
@@ -182,14 +346,19 @@ def cleanup_old_images(output_dir="images/downloads", keep_recent=20):
         if len(images) > keep_recent:
             for img_path in images[keep_recent:]:
                 os.remove(img_path)
-                print(f"Cleaned up old image: {img_path}")
+                log.debug("Cleaned up old image: %s", img_path)
+
+            # Forget remembered paths so deleted images get fetched again
+            _query_paths.clear()
+            _downloaded_photos.clear()
 
     except Exception as e:
-        print(f"Error during cleanup: {e}")
+        log.warning("Error during cleanup: %s", e)
 
 
 # Test function
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     print("Testing Pexels Image Fetcher...")
 
     # Test search
@@ -5,21 +5,206 @@ Uses pre-designed templates and allows interactive editing of individual slides
 
 import os
 import json
+import asyncio
 import random
-from typing import Dict, List, Any, Optional
+import hashlib
+import threading
+import functools
+import re
+import time
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
 from dotenv import load_dotenv
-from openai import OpenAI
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
-from PIL import Image
+from pptx.util import Inches
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn, nsdecls
+from pptx.shapes.shapetree import SlideShapeFactory
 import io
 
+# Faster JSON parsing when orjson is installed (optional; its decode
+# errors subclass json.JSONDecodeError, so error handling is unchanged)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
+# Markdown code fence around JSON in model replies
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|\Z)", re.S)
+
+# Any character that isn't a letter, digit or underscore (unsafe in file names)
+_UNSAFE_FILENAME_CHAR_RE = re.compile(r"\W")
+
+# Font sizes (pt) for generated slide text
+TITLE_SIZE = 40
+SUBTITLE_SIZE = 24
+BODY_SIZE = 20
+STAT_SIZE = 72
+CONTEXT_SIZE = 18
+
+# Tag of autoshapes/text boxes, the only template shapes with a text frame
+_SHAPE_TAG = qn('p:sp')
+
+# Run with its formatting baked in; parsed once per text frame, then copied
+_RUN_XML = f'<a:r {nsdecls("a")}><a:rPr{{attrs}}/><a:t/></a:r>'
+_EMPTY_PARAGRAPH_XML = f'<a:p {nsdecls("a")}/>'
+_LINE_BREAK = parse_xml(f'<a:br {nsdecls("a")}/>')
+
+# JSON mode: the API guarantees the reply is a valid JSON object
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Structured output for the outline: the reply always matches this schema
+OUTLINE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "presentation_outline",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "presentation_title": {"type": "string"},
+                "slides": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "number": {"type": "integer"},
+                            "type": {"type": "string"},
+                            "topic": {"type": "string"},
+                            "description": {"type": "string"}
+                        },
+                        "required": ["number", "type", "topic", "description"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["presentation_title", "slides"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Where ResponseCache keeps replies to earlier identical requests
+RESPONSE_CACHE_DIR = os.path.join('output', '.llm_cache')
+
+# Seconds before an OpenAI request is abandoned (and retried)
+OPENAI_TIMEOUT = 60.0
+
+# Most per-slide content requests in flight at once
+CONTENT_CONCURRENCY = 10
+
+# Transient OpenAI errors (rate limits, timeouts, 5xx) are retried with
+# exponential backoff: 1s, 2s, 4s, ... capped at RETRY_MAX_WAIT
+RETRY_ATTEMPTS = 5
+RETRY_MAX_WAIT = 30.0
+
+# Folder holding the theme templates (see TemplatePPTGenerator.THEMES)
+TEMPLATE_DIR = 'templates'
+
+# Theme used when none (or an unknown one) is chosen
+DEFAULT_THEME = 'modern_blue'
+
+
+def safe_filename(text: str, max_length: int = 30) -> str:
+    """
+    Turn a topic into a file-name-safe string
+
+    Every character that isn't a letter, digit or underscore becomes "_",
+    in one regex pass.
+
+    Args:
+        text: Text to convert (e.g. the presentation topic)
+        max_length: Characters of `text` to keep
+
+    Returns:
+        Safe string for use in a file name
+    """
+    return _UNSAFE_FILENAME_CHAR_RE.sub("_", text[:max_length])
+
+
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: Optional[str]):
+    """
+    One OpenAI client (and HTTP connection pool) per API key, shared by agents
+
+    Every agent - each Streamlit session, each deck in generate_presentations -
+    reuses the same kept-alive connections instead of opening new TLS
+    sessions. The SDK's own retries are off because _chat/_achat retry with
+    backoff already; leaving both on would multiply the attempts.
+    """
+    import httpx
+    from openai import OpenAI
+
+    return OpenAI(
+        api_key=api_key,
+        max_retries=0,
+        timeout=OPENAI_TIMEOUT,
+        http_client=httpx.Client(
+            timeout=OPENAI_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        ),
+    )
+
+
+def _save_atomically(prs, output_path: str) -> None:
+    """
+    Save a presentation so the output file is never left half-written
+
+    The deck is serialized in memory, written to a temporary file next to
+    the target and then renamed over it in one step.
+    """
+    buffer = io.BytesIO()
+    prs.save(buffer)
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(buffer.getbuffer())
+    os.replace(tmp_path, output_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _empty_presentation_bytes() -> bytes:
+    """
+    Build the blank 16:9 output presentation once and keep it as bytes
+
+    Every generator starts its output from this, so the default python-pptx
+    package is loaded and resized only once per process.
+    """
+    prs = Presentation()
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(5.625)
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=1)
+def _available_template_files() -> frozenset:
+    """
+    List the templates folder once and remember which .pptx files exist
+
+    Every generator checks its theme file (and possibly the fallbacks), so
+    a single directory scan replaces a stat call per check.
+    """
+    try:
+        names = os.listdir(TEMPLATE_DIR)
+    except OSError:
+        return frozenset()
+    return frozenset(
+        os.path.normpath(os.path.join(TEMPLATE_DIR, name))
+        for name in names if name.endswith('.pptx')
+    )
+
+
+def _template_exists(template_path: str) -> bool:
+    """Check a template path against the cached directory listing"""
+    return os.path.normpath(template_path) in _available_template_files()
+
 
 class TemplatePPTGenerator:
     """
@@ -29,16 +214,16 @@ class TemplatePPTGenerator:
 
     # Available themes matching our clean templates
     THEMES = {
-        'modern_blue': {'name': 'Modern Blue', 'file': 'templates/modern_blue_clean.pptx'},
-        'elegant_purple': {'name': 'Elegant Purple', 'file': 'templates/elegant_purple_clean.pptx'},
-        'corporate_green': {'name': 'Corporate Green', 'file': 'templates/corporate_green_clean.pptx'},
-        'vibrant_orange': {'name': 'Vibrant Orange', 'file': 'templates/vibrant_orange_clean.pptx'},
-        'dark_professional': {'name': 'Dark Professional', 'file': 'templates/dark_professional_clean.pptx'},
-        'minimal_gray': {'name': 'Minimal Gray', 'file': 'templates/minimal_gray_clean.pptx'},
-        'ocean_teal': {'name': 'Ocean Teal', 'file': 'templates/ocean_teal_clean.pptx'},
-        'sunset_red': {'name': 'Sunset Red', 'file': 'templates/sunset_red_clean.pptx'},
-        'royal_indigo': {'name': 'Royal Indigo', 'file': 'templates/royal_indigo_clean.pptx'},
-        'forest_brown': {'name': 'Forest Brown', 'file': 'templates/forest_brown_clean.pptx'}
+        'modern_blue': {'name': 'Modern Blue', 'file': 'templates/modern_blue_clean.pptx', 'description': 'Technology, business, professional'},
+        'elegant_purple': {'name': 'Elegant Purple', 'file': 'templates/elegant_purple_clean.pptx', 'description': 'Creative, luxury, artistic'},
+        'corporate_green': {'name': 'Corporate Green', 'file': 'templates/corporate_green_clean.pptx', 'description': 'Sustainability, finance, growth'},
+        'vibrant_orange': {'name': 'Vibrant Orange', 'file': 'templates/vibrant_orange_clean.pptx', 'description': 'Energy, innovation, dynamic'},
+        'dark_professional': {'name': 'Dark Professional', 'file': 'templates/dark_professional_clean.pptx', 'description': 'Tech, modern, sophisticated'},
+        'minimal_gray': {'name': 'Minimal Gray', 'file': 'templates/minimal_gray_clean.pptx', 'description': 'Minimalist, clean, neutral'},
+        'ocean_teal': {'name': 'Ocean Teal', 'file': 'templates/ocean_teal_clean.pptx', 'description': 'Healthcare, wellness, calm'},
+        'sunset_red': {'name': 'Sunset Red', 'file': 'templates/sunset_red_clean.pptx', 'description': 'Passion, urgency, bold'},
+        'royal_indigo': {'name': 'Royal Indigo', 'file': 'templates/royal_indigo_clean.pptx', 'description': 'Authority, traditional, corporate'},
+        'forest_brown': {'name': 'Forest Brown', 'file': 'templates/forest_brown_clean.pptx', 'description': 'Natural, organic, earthy'}
     }
 
     # Layout mapping (which slide number in template to use for which purpose)
@@ -60,24 +245,33 @@ class TemplatePPTGenerator:
         'dashboard': 14       # Slide 15: Dashboard
     }
 
-    def __init__(self, theme_key: str = 'modern_blue'):
+    # Template path -> parsed template, and template path -> its cached
+    # shape elements / text shape order (see _shared_template and
+    # _template_shape_elements)
+    _template_cache = {}
+    _template_elements_cache = {}
+    _template_text_order_cache = {}
+    _template_cache_lock = threading.Lock()
+
+    def __init__(self, theme_key: str = DEFAULT_THEME):
         """Initialize generator with a specific theme"""
         self.theme_key = theme_key
-        self.theme = self.THEMES.get(theme_key, self.THEMES['modern_blue'])
+        self.theme = self.THEMES.get(theme_key) or self.THEMES[DEFAULT_THEME]
         self.template_path = self.theme['file']
 
         # Load template presentation - fallback to any available template
-        if os.path.exists(self.template_path):
-            self.template_prs = Presentation(self.template_path)
+        # Parsed templates are shared by all generators (they're only read)
+        if _template_exists(self.template_path):
+            self.template_prs = self._shared_template(self.template_path)
             print(f"Using template: {self.template_path}")
         else:
             print(f"Warning: Template {self.template_path} not found. Trying alternatives...")
             # Try to find ANY available template
             for alt_theme_key, alt_theme in self.THEMES.items():
                 alt_path = alt_theme['file']
-                if os.path.exists(alt_path):
+                if _template_exists(alt_path):
                     self.template_path = alt_path
-                    self.template_prs = Presentation(alt_path)
+                    self.template_prs = self._shared_template(alt_path)
                     self.theme_key = alt_theme_key
                     print(f"Using alternative template: {alt_path}")
                     break
@@ -86,10 +280,48 @@ class TemplatePPTGenerator:
                 print("No templates found! Using blank presentation.")
                 self.template_prs = Presentation()
 
-        # Create new presentation for output
-        self.prs = Presentation()
-        self.prs.slide_width = Inches(10)
-        self.prs.slide_height = Inches(5.625)
+        # Create new (empty, 16:9) presentation for output
+        self.prs = Presentation(io.BytesIO(_empty_presentation_bytes()))
+
+        # Blank layout used for every generated slide (looked up once)
+        self._blank_layout = self.prs.slide_layouts[6]
+
+        # Output slide index -> its text shapes sorted top to bottom (None if
+        # unknown), so later edits of a slide don't rescan its shapes
+        self.slide_text_shapes = []
+
+        # Template slide index -> its shape elements (filled on first use,
+        # shared by every generator using the same template)
+        self._template_elements = self._template_elements_cache.setdefault(self.template_path, {})
+        self._template_text_orders = self._template_text_order_cache.setdefault(self.template_path, {})
+
+    @classmethod
+    def _shared_template(cls, template_path: str):
+        """
+        Parse a template once per process and share it between generators
+
+        Slides are deep-copied out of the template and it is never modified,
+        so one parsed copy can serve every deck (and every thread).
+        """
+        with cls._template_cache_lock:
+            template_prs = cls._template_cache.get(template_path)
+            if template_prs is None:
+                template_prs = Presentation(template_path)
+                cls._template_cache[template_path] = template_prs
+            return template_prs
+
+    @classmethod
+    def available_themes(cls) -> List[str]:
+        """
+        Theme keys whose template file is present
+
+        Uses the cached templates folder listing, so it is cheap enough to
+        call when building theme menus or validating a user's choice.
+
+        Returns:
+            List of theme keys
+        """
+        return [key for key, theme in cls.THEMES.items() if _template_exists(theme['file'])]
 
     def copy_slide(self, template_slide_idx: int, content: Dict) -> None:
         """
@@ -99,47 +331,180 @@ class TemplatePPTGenerator:
             template_slide_idx: Index of slide in template to copy
             content: Dictionary with text content to populate
         """
-        # Get template slide
+        source_elements = self._template_shape_elements(template_slide_idx)
+        if source_elements is None:
+            return
+
+        new_elements = self._prepare_slide_elements(source_elements)
+        self._commit_slide(new_elements, content, self._template_text_orders[template_slide_idx])
+
+    def copy_slides(self, slides: List[Tuple[int, Dict]]) -> None:
+        """
+        Copy several template slides in order
+
+        All template shape copies are prepared first (they don't touch the
+        output presentation), then the slides are added and filled in order.
+
+        Args:
+            slides: List of (template_slide_idx, content) pairs
+        """
+        jobs = []
+        for template_slide_idx, content in slides:
+            source_elements = self._template_shape_elements(template_slide_idx)
+            if source_elements is not None:
+                jobs.append((source_elements, self._template_text_orders[template_slide_idx], content))
+
+        prepared = [self._prepare_slide_elements(source_elements) for source_elements, _, _ in jobs]
+
+        for new_elements, (_, text_order, content) in zip(prepared, jobs):
+            self._commit_slide(new_elements, content, text_order)
+
+    def _template_shape_elements(self, template_slide_idx: int) -> Optional[List]:
+        """
+        Return the shape elements of a template slide, or None if it doesn't exist
+
+        The template is never modified, so each slide's element list is
+        collected once and reused for every later copy of that layout, by
+        this and every other generator using the same template.
+        """
+        if template_slide_idx in self._template_elements:
+            return self._template_elements[template_slide_idx]
+
         if template_slide_idx >= len(self.template_prs.slides):
             print(f"Warning: Template slide {template_slide_idx} not found")
-            return
+            return None
 
         template_slide = self.template_prs.slides[template_slide_idx]
+        elements = [shape.element for shape in template_slide.shapes]
+        self._template_text_orders[template_slide_idx] = self._text_shape_order(elements)
+        self._template_elements[template_slide_idx] = elements
+        return elements
+
+    def _text_shape_order(self, elements: List) -> List[int]:
+        """
+        Positions of the text-bearing shapes in a template slide, top to bottom
+
+        Only autoshapes/text boxes (<p:sp>) have a text frame, exactly the
+        shapes _populate_slide_content looks for; computed once per template
+        slide so copies skip the scan and the sort.
+        """
+        text_positions = [i for i, el in enumerate(elements) if el.tag == _SHAPE_TAG]
+        text_positions.sort(key=lambda i: elements[i].y)
+        return text_positions
 
+    def _prepare_slide_elements(self, source_elements: List) -> List:
+        """Deep copy template shape elements (does not modify the output presentation)"""
+        return [self._copy_element(el) for el in source_elements]
+
+    def _commit_slide(self, new_elements: List, content: Dict,
+                      text_order: Optional[List[int]] = None) -> None:
+        """Add a slide holding the prepared shape elements and populate its text"""
         # Create new slide from blank layout
-        new_slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        new_slide = self.prs.slides.add_slide(self._blank_layout)
+
+        # Insert all copied shapes in one tree mutation
+        sp_tree = new_slide.shapes._spTree
+        ext_lst = sp_tree.find(qn('p:extLst'))
+        if ext_lst is not None:
+            insert_at = sp_tree.index(ext_lst)
+            sp_tree[insert_at:insert_at] = new_elements
+        else:
+            sp_tree.extend(new_elements)
 
-        # Copy all shapes from template
-        for shape in template_slide.shapes:
-            # Copy the shape's element
-            el = shape.element
-            new_el = self._copy_element(el)
-            new_slide.shapes._spTree.insert_element_before(new_el, 'p:extLst')
+        # Text shapes straight from the template's precomputed order
+        text_shapes = None
+        if text_order is not None:
+            shapes = new_slide.shapes
+            text_shapes = [SlideShapeFactory(new_elements[i], shapes) for i in text_order]
 
         # Update text content based on content dict
-        self._populate_slide_content(new_slide, content)
+        self._populate_slide_content(new_slide, content, text_shapes)
+        self.slide_text_shapes.append(text_shapes)
 
     def _copy_element(self, element):
-        """Deep copy an XML element"""
-        from copy import deepcopy
+        """
+        Deep copy an XML element
+
+        copy.deepcopy on an lxml element dispatches straight to lxml's own
+        C-level __deepcopy__, so no serialize/parse round trip is needed.
+        """
         return deepcopy(element)
 
-    def _populate_slide_content(self, slide, content: Dict) -> None:
+    def _write_paragraphs(self, text_frame, texts: List[str], size: int,
+                          bold: Optional[bool] = None) -> None:
+        """
+        Replace a text frame's paragraphs with one paragraph per string
+
+        The run properties are parsed into one prototype run, and every run
+        is a copy of it with its text filled in, so no font setters run
+        per paragraph. All paragraphs are appended in one go. Every paragraph
+        reuses the template's first paragraph properties (alignment, colour,
+        font). Line breaks inside a string become <a:br/>, as with
+        paragraph.text.
+
+        Args:
+            text_frame: Text frame to fill (its old paragraphs are removed)
+            texts: Paragraph strings
+            size: Font size in points
+            bold: True/False to force bold, None to keep the template's
+        """
+        if not texts:
+            text_frame.clear()
+            return
+
+        sz = str(size * 100)
+        attrs = f' sz="{sz}"'
+        if bold is not None:
+            attrs += f' b="{int(bold)}"'
+
+        txBody = text_frame._txBody
+        old_paragraphs = txBody.p_lst
+        pPr = old_paragraphs[0].get_or_add_pPr()
+        defRPr = pPr.get_or_add_defRPr()
+        defRPr.set('sz', sz)
+        if bold is not None:
+            defRPr.set('b', str(int(bold)))
+
+        # Prototypes built once, then copied for every paragraph / run
+        proto_p = parse_xml(_EMPTY_PARAGRAPH_XML)
+        proto_p.append(deepcopy(pPr))
+        proto_run = parse_xml(_RUN_XML.format(attrs=attrs))
+
+        new_paragraphs = []
+        for text in texts:
+            p = deepcopy(proto_p)
+            for i, line in enumerate(str(text).replace('\v', '\n').split('\n')):
+                if i:
+                    p.append(deepcopy(_LINE_BREAK))
+                if line:
+                    run = deepcopy(proto_run)
+                    run.text = line  # Escapes control characters, as paragraph.text does
+                    p.append(run)
+            new_paragraphs.append(p)
+
+        for p in old_paragraphs:
+            txBody.remove(p)
+        txBody.extend(new_paragraphs)
+
+    def _populate_slide_content(self, slide, content: Dict, text_shapes: Optional[List] = None) -> None:
         """
         Populate slide with actual content - AGGRESSIVE VERSION
 
         Args:
             slide: PowerPoint slide object
             content: Dict with keys like 'title', 'subtitle', 'bullets', 'text'
+            text_shapes: Text shapes already sorted top to bottom (found by
+                scanning the slide when not given)
         """
-        # Collect all text shapes sorted by top position (top to bottom)
-        text_shapes = []
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                text_shapes.append(shape)
+        if text_shapes is None:
+            # Collect all text shapes sorted by top position (top to bottom)
+            text_shapes = []
+            for shape in slide.shapes:
+                if shape.has_text_frame:
+                    text_shapes.append(shape)
 
-        # Sort by vertical position (top to bottom)
-        text_shapes.sort(key=lambda s: s.top)
+            # Sort by vertical position (top to bottom)
+            text_shapes.sort(key=lambda s: s.top)
 
         # Strategy: Replace text boxes from top to bottom with our content
         shape_idx = 0
@@ -147,14 +512,7 @@ class TemplatePPTGenerator:
         # First shape usually = title
         if shape_idx < len(text_shapes) and 'title' in content:
             text_frame = text_shapes[shape_idx].text_frame
-            text_frame.clear()
-            p = text_frame.paragraphs[0]
-            p.text = content['title']
-            p.font.bold = True
-            p.font.size = Pt(40)
-            for run in p.runs:
-                run.font.bold = True
-                run.font.size = Pt(40)
+            self._write_paragraphs(text_frame, [content['title']], TITLE_SIZE, bold=True)
             shape_idx += 1
 
         # Second shape usually = subtitle or content
@@ -163,50 +521,22 @@ class TemplatePPTGenerator:
 
             # If we have subtitle, use it
             if 'subtitle' in content:
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                p.text = content['subtitle']
-                p.font.size = Pt(24)
-                for run in p.runs:
-                    run.font.size = Pt(24)
+                self._write_paragraphs(text_frame, [content['subtitle']], SUBTITLE_SIZE)
                 shape_idx += 1
 
             # If we have bullets, populate them
             elif 'bullets' in content:
-                text_frame.clear()
-                for i, bullet in enumerate(content['bullets'][:6]):  # Max 6 bullets
-                    if i == 0:
-                        p = text_frame.paragraphs[0]
-                    else:
-                        p = text_frame.add_paragraph()
-                    p.text = bullet
-                    p.level = 0
-                    p.font.size = Pt(20)
-                    for run in p.runs:
-                        run.font.size = Pt(20)
-                        run.font.bold = False
+                self._write_paragraphs(text_frame, content['bullets'][:6], BODY_SIZE, bold=False)  # Max 6 bullets
                 shape_idx += 1
 
             # If we have text content
             elif 'text' in content:
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                p.text = content['text']
-                p.font.size = Pt(20)
-                for run in p.runs:
-                    run.font.size = Pt(20)
+                self._write_paragraphs(text_frame, [content['text']], BODY_SIZE)
                 shape_idx += 1
 
             # If we have stat
             elif 'stat' in content:
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                p.text = content['stat']
-                p.font.bold = True
-                p.font.size = Pt(72)
-                for run in p.runs:
-                    run.font.bold = True
-                    run.font.size = Pt(72)
+                self._write_paragraphs(text_frame, [content['stat']], STAT_SIZE, bold=True)
                 shape_idx += 1
 
         # Third shape (if exists) - for additional content
@@ -220,41 +550,166 @@ class TemplatePPTGenerator:
 
             # If we have description for stat
             elif 'description' in content and 'stat' in content:
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                p.text = content['description']
-                p.font.size = Pt(20)
-                for run in p.runs:
-                    run.font.size = Pt(20)
+                self._write_paragraphs(text_frame, [content['description']], BODY_SIZE)
                 shape_idx += 1
 
             # If we have context
             elif 'context' in content:
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                p.text = content['context']
-                p.font.size = Pt(18)
-                for run in p.runs:
-                    run.font.size = Pt(18)
+                self._write_paragraphs(text_frame, [content['context']], CONTEXT_SIZE)
                 shape_idx += 1
 
     def save(self, output_path: str) -> str:
         """Save the presentation"""
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-        self.prs.save(output_path)
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        _save_atomically(self.prs, output_path)
         return output_path
 
 
+class ResponseCache:
+    """
+    Exact-match cache of chat completion replies on disk
+
+    Each reply is stored in its own small JSON file named by a hash of the
+    request (model, prompt, temperature, response format), so regenerating
+    the same deck or re-applying the same edit skips the API call. Files are
+    written atomically, so threads and processes can share the folder.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _path(self, request: Dict) -> str:
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, request: Dict) -> Optional[str]:
+        """Return the cached reply for a request, or None"""
+        try:
+            with open(self._path(request), 'r', encoding='utf-8') as f:
+                return json.load(f)['content']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, request: Dict, content: str) -> None:
+        """Store the reply for a request"""
+        if not content:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(request)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'content': content}, f)
+        os.replace(tmp_path, path)
+
+
+class _StreamingArrayParser:
+    """
+    Pulls complete JSON objects out of an array (e.g. "slides": [...])
+    while the JSON text is still being streamed in
+    """
+
+    def __init__(self, key: str):
+        self._marker = f'"{key}"'
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._obj_start = None
+
+    def feed(self, text: str) -> List[Optional[Dict]]:
+        """Add streamed text and return any objects completed by it (None for unparseable ones)"""
+        self._buffer += text
+        found = []
+        if self._done:
+            return found
+
+        # Wait until the array for our key has started
+        if not self._in_array:
+            marker_at = self._buffer.find(self._marker)
+            if marker_at == -1:
+                return found
+            bracket_at = self._buffer.find("[", marker_at + len(self._marker))
+            if bracket_at == -1:
+                return found
+            self._in_array = True
+            self._pos = bracket_at + 1
+
+        buf = self._buffer
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+
+            # Skip over string contents (braces inside strings don't count)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._obj_start = i
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0 and self._obj_start is not None:
+                    try:
+                        found.append(_json_loads(buf[self._obj_start:i + 1]))
+                    except json.JSONDecodeError:
+                        found.append(None)  # Keeps later objects at their positions
+                    self._obj_start = None
+            elif ch == "]" and self._depth == 0:
+                # End of the array - nothing more to extract
+                self._done = True
+                break
+
+        self._pos = len(buf)
+        return found
+
+
 class ConversationalPPTAgent:
     """
     Single AI Agent for conversational PowerPoint creation
     Handles outline generation, content creation, and iterative editing
     """
 
-    def __init__(self):
-        """Initialize the conversational agent"""
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    # Theme choices for validation and the theme-selection prompt, built once from THEMES
+    THEME_KEYS = frozenset(TemplatePPTGenerator.THEMES)
+    THEME_KEYS_JSON = json.dumps(list(TemplatePPTGenerator.THEMES))
+    THEME_GUIDE = "\n".join(
+        f"- {key}: {theme['description']}" for key, theme in TemplatePPTGenerator.THEMES.items()
+    )
+
+    def __init__(self, use_cache: bool = False):
+        """
+        Initialize the conversational agent
+
+        Args:
+            use_cache: Reuse replies to identical earlier requests (stored
+                under RESPONSE_CACHE_DIR) instead of calling the API again.
+                Off by default: with it on, the same topic always gets the
+                same outline and content back.
+        """
+        # Imported here so modules that only need TemplatePPTGenerator
+        # (or Streamlit reloads of app.py) don't pay for loading openai
+        import openai
+
+        self.client = _openai_client(os.getenv("OPENAI_API_KEY"))
+        self._retryable_errors = (
+            openai.RateLimitError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        )
         self.model = "gpt-4o-mini"  # Using GPT-4 for better quality
+        self.cache = ResponseCache(RESPONSE_CACHE_DIR) if use_cache else None
 
         # Session state
         self.outline = None
@@ -262,13 +717,29 @@ class ConversationalPPTAgent:
         self.slides_content = []
         self.ppt_generator = None
 
-    def generate_outline(self, topic: str, num_slides: int) -> Dict:
+        # Path the in-memory deck was last saved to, and whether it has
+        # edits (from modify_slide(..., flush=False)) not written there yet
+        self._live_path = None
+        self._unsaved_edits = False
+
+        # (content hash, review) of the last self-review, so reviewing an
+        # unchanged deck again doesn't cost another request
+        self._last_review = None
+
+    def generate_outline(self, topic: str, num_slides: int,
+                         on_slide: Optional[Callable[[Dict], None]] = None) -> Dict:
         """
         STEP 1: Generate presentation outline for user review
 
+        The response is streamed, so each slide entry is handed to `on_slide`
+        as soon as the model finishes writing it instead of after the whole
+        outline has arrived.
+
         Args:
             topic: Presentation topic
             num_slides: Number of slides requested
+            on_slide: Optional callback for each outline slide as it arrives
+                (defaults to printing it)
 
         Returns:
             Dict with outline structure
@@ -301,26 +772,164 @@ Respond with JSON:
     ]
 }}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7
-        )
+        if on_slide is None:
+            on_slide = self._print_outline_slide
+
+        # Stream the response and surface finished slide entries early
+        print()
+        parser = _StreamingArrayParser('slides')
+        chunks = []
+        for delta in self._stream_chat(prompt, temperature=0.7, response_format=OUTLINE_RESPONSE_FORMAT):
+            chunks.append(delta)
+            for slide in parser.feed(delta):
+                if slide is not None:
+                    on_slide(slide)
 
-        outline = self._extract_json(response.choices[0].message.content)
+        outline = self._extract_json("".join(chunks))
         self.outline = outline
 
-        # Display outline
-        print(f"\nPresentation: {outline.get('presentation_title', 'Untitled')}")
+        # Display outline summary
+        print(f"Presentation: {outline.get('presentation_title', 'Untitled')}")
         print(f"Total Slides: {len(outline.get('slides', []))}\n")
 
-        for slide in outline.get('slides', []):
-            print(f"  Slide {slide['number']}: {slide['topic']}")
-            print(f"    Type: {slide['type']}")
-            print(f"    Content: {slide['description']}\n")
-
         return outline
 
+    def _print_outline_slide(self, slide: Dict) -> None:
+        """Print one outline slide entry"""
+        print(f"  Slide {slide.get('number', '?')}: {slide.get('topic', '')}")
+        print(f"    Type: {slide.get('type', '')}")
+        print(f"    Content: {slide.get('description', '')}\n")
+
+    def _chat(self, **kwargs):
+        """
+        Call chat.completions.create, retrying transient errors
+
+        Rate limits, timeouts, dropped connections and 5xx responses are
+        retried with exponential backoff, so one hiccup doesn't throw away
+        every slide generated so far.
+
+        Args:
+            **kwargs: Arguments for client.chat.completions.create
+
+        Returns:
+            The API response (or stream, when stream=True)
+        """
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                return self.client.chat.completions.create(**kwargs)
+            except self._retryable_errors as e:
+                if attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                wait = min(RETRY_MAX_WAIT, 2 ** attempt) + random.uniform(0, 1)
+                print(f"  OpenAI request failed ({type(e).__name__}), retrying in {wait:.1f}s...")
+                time.sleep(wait)
+
+    async def _achat(self, aclient, **kwargs):
+        """Async version of _chat: same retries, but waits without blocking the loop"""
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                return await aclient.chat.completions.create(**kwargs)
+            except self._retryable_errors as e:
+                if attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                wait = min(RETRY_MAX_WAIT, 2 ** attempt) + random.uniform(0, 1)
+                print(f"  OpenAI request failed ({type(e).__name__}), retrying in {wait:.1f}s...")
+                await asyncio.sleep(wait)
+
+    def _chat_request(self, prompt: str, temperature: float,
+                      response_format: Optional[Dict] = None) -> Dict:
+        """Build the chat.completions.create arguments for a single-prompt call"""
+        request = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+        if response_format:
+            request["response_format"] = response_format
+        return request
+
+    def _complete(self, prompt: str, temperature: float,
+                  response_format: Optional[Dict] = None) -> str:
+        """
+        Send a single prompt and return the reply text
+
+        An identical earlier request (same model, prompt and settings) is
+        answered from the response cache (when enabled) without calling the API.
+
+        Args:
+            prompt: User prompt to send
+            temperature: Sampling temperature
+            response_format: Optional OpenAI response_format (JSON mode/schema)
+
+        Returns:
+            Reply text
+        """
+        request = self._chat_request(prompt, temperature, response_format)
+
+        cached = self.cache.get(request) if self.cache else None
+        if cached is not None:
+            return cached
+
+        response = self._chat(**request)
+        reply = response.choices[0].message.content or ""
+        self._cache_reply(request, reply, response.choices[0].finish_reason)
+        return reply
+
+    def _cache_reply(self, request: Dict, reply: str, finish_reason: Optional[str]) -> None:
+        """
+        Store a reply in the response cache if it is safe to reuse
+
+        Only complete replies (finish_reason "stop") are kept, and replies to
+        JSON requests must also parse, so a truncated or malformed reply is
+        never served again on later runs.
+        """
+        if not self.cache or finish_reason != "stop":
+            return
+        if request.get("response_format"):
+            try:
+                _json_loads(reply)
+            except json.JSONDecodeError:
+                return
+        self.cache.put(request, reply)
+
+    def _stream_chat(self, prompt: str, temperature: float,
+                     response_format: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Stream a chat completion, yielding text chunks as they arrive
+
+        Args:
+            prompt: User prompt to send
+            temperature: Sampling temperature
+            response_format: Optional OpenAI response_format (JSON mode/schema)
+
+        Yields:
+            Pieces of the response text
+        """
+        request = self._chat_request(prompt, temperature, response_format)
+
+        # Cached reply: hand it over as a single chunk
+        cached = self.cache.get(request) if self.cache else None
+        if cached is not None:
+            yield cached
+            return
+
+        stream = self._chat(stream=True, **request)
+
+        chunks = []
+        finish_reason = None
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            if choice.delta.content:
+                chunks.append(choice.delta.content)
+                yield choice.delta.content
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+        # Only cache replies that were read to the end and finished normally
+        self._cache_reply(request, "".join(chunks), finish_reason)
+
     def select_theme(self, user_preference: Optional[str] = None) -> str:
         """
         STEP 2: Select theme based on presentation topic
@@ -335,68 +944,294 @@ Respond with JSON:
         print("STEP 2: Selecting Presentation Theme")
         print("="*70)
 
-        if user_preference and user_preference in TemplatePPTGenerator.THEMES:
+        themes = TemplatePPTGenerator.THEMES
+        if (user_preference in self.THEME_KEYS and self.ppt_generator
+                and self.ppt_generator.theme_key == user_preference):
+            # Same theme again: keep the generator and the deck built with it
+            print(f"\nTheme unchanged: {themes[user_preference]['name']}")
+            return user_preference
+
+        if user_preference in self.THEME_KEYS:
             theme_key = user_preference
-            print(f"\nUsing user-selected theme: {TemplatePPTGenerator.THEMES[theme_key]['name']}")
+            print(f"\nUsing user-selected theme: {themes[theme_key]['name']}")
         else:
             # AI selects theme based on topic
             if not self.outline:
-                theme_key = 'modern_blue'
+                theme_key = DEFAULT_THEME
             else:
                 prompt = f"""Based on this presentation topic: "{self.outline.get('presentation_title', '')}"
 
 Select the most appropriate theme from:
-{json.dumps(list(TemplatePPTGenerator.THEMES.keys()))}
+{self.THEME_KEYS_JSON}
 
 Consider:
-- modern_blue: Technology, business, professional
-- elegant_purple: Creative, luxury, artistic
-- corporate_green: Sustainability, finance, growth
-- vibrant_orange: Energy, innovation, dynamic
-- dark_professional: Tech, modern, sophisticated
-- minimal_gray: Minimalist, clean, neutral
-- ocean_teal: Healthcare, wellness, calm
-- sunset_red: Passion, urgency, bold
-- royal_indigo: Authority, traditional, corporate
-- forest_brown: Natural, organic, earthy
+{self.THEME_GUIDE}
 
 Respond with just the theme key (e.g., "modern_blue")"""
 
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.3
-                )
+                reply = self._complete(prompt, temperature=0.3)
 
-                theme_key = response.choices[0].message.content.strip().strip('"')
-                if theme_key not in TemplatePPTGenerator.THEMES:
-                    theme_key = 'modern_blue'
+                theme_key = reply.strip().strip('"')
+                if theme_key not in self.THEME_KEYS:
+                    theme_key = DEFAULT_THEME
 
-            print(f"\nAI selected theme: {TemplatePPTGenerator.THEMES[theme_key]['name']}")
+            print(f"\nAI selected theme: {themes[theme_key]['name']}")
 
         self.theme = theme_key
         self.ppt_generator = TemplatePPTGenerator(theme_key)
+        self._live_path = None
+        self._unsaved_edits = False
 
         return theme_key
 
-    def generate_content(self) -> List[Dict]:
+    def generate_content(self, batched: bool = True) -> List[Dict]:
         """
         STEP 3: Generate detailed content for each slide
 
+        By default the whole deck is generated in one request (see
+        generate_content_batched); pass batched=False for one request per
+        slide.
+
+        The per-slide requests run concurrently (see generate_content_async).
+        This is a blocking call for ordinary code; from inside an event loop,
+        await generate_content_async() instead.
+
+        Args:
+            batched: Generate all slides in a single request
+
         Returns:
             List of slide content dictionaries
         """
+        if batched:
+            return self.generate_content_batched()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.generate_content_async())
+        raise RuntimeError(
+            "generate_content() can't start an event loop inside a running one; "
+            "use 'await agent.generate_content_async()' instead"
+        )
+
+    async def generate_content_async(self) -> List[Dict]:
+        """
+        STEP 3 (one request per slide, concurrently)
+
+        All slide requests are sent at once (at most CONTENT_CONCURRENCY in
+        flight), so the step takes about as long as the slowest slide
+        instead of the sum of all of them.
+
+        Returns:
+            List of slide content dictionaries, in outline order
+        """
+        from openai import AsyncOpenAI
+
         print("\n" + "="*70)
         print("STEP 3: Generating Slide Content")
         print("="*70)
 
+        outline_slides = self.outline.get('slides', [])
+        semaphore = asyncio.Semaphore(CONTENT_CONCURRENCY)
+
+        # One async client per run: its connections belong to this event loop
+        aclient = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0, timeout=OPENAI_TIMEOUT)
+        try:
+            slides_content = await asyncio.gather(*(
+                self._agenerate_slide_content(aclient, semaphore, slide_info)
+                for slide_info in outline_slides
+            ))
+        finally:
+            await aclient.close()
+
+        slides_content = list(slides_content)
+        self.slides_content = slides_content
+        print(f"\n  Generated content for {len(slides_content)} slides")
+
+        return slides_content
+
+    async def _agenerate_slide_content(self, aclient, semaphore, slide_info: Dict) -> Dict:
+        """Async version of _generate_slide_content (limited by `semaphore`)"""
+        request = self._chat_request(self._slide_content_prompt(slide_info), 0.7, JSON_RESPONSE_FORMAT)
+        reply = self.cache.get(request) if self.cache else None
+
+        if reply is None:
+            async with semaphore:
+                print(f"\n  Generating content for Slide {slide_info['number']}: {slide_info['topic']}...")
+                response = await self._achat(aclient, **request)
+            reply = response.choices[0].message.content or ""
+            self._cache_reply(request, reply, response.choices[0].finish_reason)
+
+        content = self._extract_json(reply)
+        return self._finish_slide_content(content, slide_info)
+
+    def generate_content_batched(self, on_slide: Optional[Callable[[int, Dict], None]] = None) -> List[Dict]:
+        """
+        STEP 3 (single request): Generate content for all slides in one call
+
+        The instructions and output formats are sent once for the whole deck
+        instead of once per slide, which cuts input tokens and the number of
+        requests counted against the rate limit. Slides missing from the
+        reply, or missing a field their type needs, are generated
+        individually.
+
+        The reply is streamed, so each slide's content is handed to
+        `on_slide` as soon as the model finishes writing it. Those same
+        objects end up in the returned list, so anything built from them
+        early matches the final content.
+
+        Args:
+            on_slide: Optional callback (slide position, raw content) for each
+                slide as it arrives (defaults to printing a progress line)
+
+        Returns:
+            List of slide content dictionaries
+        """
+        print("\n" + "="*70)
+        print("STEP 3: Generating Slide Content (single request)")
+        print("="*70)
+
+        outline_slides = self.outline.get('slides', [])
+        slide_lines = "\n".join(
+            f"{i}. [{s['type']}] Topic: {s['topic']} | Description: {s['description']}"
+            for i, s in enumerate(outline_slides, 1)
+        )
+
+        prompt = f"""Create content for every slide of the presentation "{self.outline.get('presentation_title', '')}".
+
+Slides:
+{slide_lines}
+
+Use this JSON shape for each slide, depending on its type:
+- title: {{"title": "Main Title", "subtitle": "Engaging subtitle"}}
+- content or bullets: {{"title": "Slide Title", "bullets": ["Point 1 with details", "Point 2 with details", "Point 3 with details", "Point 4 with details"]}}
+- stat: {{"stat": "95%", "description": "What this statistic means", "context": "Additional context"}}
+- any other type: {{"title": "Slide Title", "text": "Main content text for this slide"}}
+
+Respond with JSON containing one object per slide, in the same order:
+{{"slides": [...]}}"""
+
+        if on_slide is None:
+            on_slide = self._print_content_progress
+
+        # Stream the response and report each slide as soon as it is complete
+        parser = _StreamingArrayParser('slides')
+        chunks = []
+        streamed = []
+        for delta in self._stream_chat(prompt, temperature=0.7, response_format=JSON_RESPONSE_FORMAT):
+            chunks.append(delta)
+            for slide in parser.feed(delta):
+                if slide is not None:
+                    on_slide(len(streamed), slide)
+                streamed.append(slide)
+
+        # Keep the objects already handed to on_slide; parse the full reply
+        # only for slides the stream didn't deliver
+        generated = streamed
+        if len(generated) < len(outline_slides):
+            result = self._extract_json("".join(chunks))
+            parsed = result.get('slides', []) if isinstance(result, dict) else []
+            generated = streamed + parsed[len(streamed):]
+
         slides_content = []
+        for i, slide_info in enumerate(outline_slides):
+            item = generated[i] if i < len(generated) else None
+            if self._is_complete_content(item, slide_info['type']):
+                content = self._finish_slide_content(item, slide_info)
+            else:
+                # Repair path: missing or incomplete in the batched reply
+                print(f"\n  Slide {slide_info['number']} missing or incomplete in batched reply, generating separately...")
+                content = self._generate_slide_content(slide_info)
+            slides_content.append(content)
+
+        self.slides_content = slides_content
+        print(f"\n  Generated content for {len(slides_content)} slides")
 
+        return slides_content
+
+    def submit_content_batch(self) -> str:
+        """
+        Submit content generation for every outline slide as one OpenAI Batch job
+
+        For offline/bulk runs (e.g. building a whole syllabus of decks) the
+        Batch API costs half as much as regular requests and uses a separate
+        rate-limit pool. Results arrive asynchronously (within 24h) and are
+        collected with collect_content_batch().
+
+        Returns:
+            Batch job ID
+        """
+        lines = []
         for slide_info in self.outline.get('slides', []):
-            print(f"\n  Generating content for Slide {slide_info['number']}: {slide_info['topic']}...")
+            lines.append(json.dumps({
+                "custom_id": f"slide-{slide_info['number']}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": self._slide_content_prompt(slide_info)}],
+                    "temperature": 0.7,
+                    "response_format": JSON_RESPONSE_FORMAT
+                }
+            }))
+
+        batch_file = self.client.files.create(
+            file=("slide_content.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        print(f"  Submitted batch {batch.id} for {len(lines)} slides")
+        return batch.id
+
+    def collect_content_batch(self, batch_id: str, poll_interval: float = 30.0,
+                              max_poll_interval: float = 600.0) -> List[Dict]:
+        """
+        Wait for a content batch to finish and load its results as slide content
 
-            # Generate content based on slide type
-            content = self._generate_slide_content(slide_info)
+        Slides whose batch request failed are regenerated with a regular call.
+
+        Args:
+            batch_id: ID returned by submit_content_batch()
+            poll_interval: Seconds before the first status check; the wait
+                doubles after each check (batches can take hours)
+            max_poll_interval: Longest wait between status checks
+
+        Returns:
+            List of slide content dictionaries
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            print(f"  Batch {batch_id}: {batch.status}, checking again in {poll_interval:.0f}s...")
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, max_poll_interval)
+            batch = self.client.batches.retrieve(batch_id)
+
+        # Map each successful response back to its slide
+        results = {}
+        if batch.status == 'completed' and batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get('response') or {}
+                if response.get('status_code') == 200:
+                    results[item['custom_id']] = response['body']['choices'][0]['message']['content']
+        else:
+            print(f"  Batch {batch_id} ended with status: {batch.status}")
+
+        slides_content = []
+        for slide_info in self.outline.get('slides', []):
+            text = results.get(f"slide-{slide_info['number']}")
+            if text is None:
+                content = self._generate_slide_content(slide_info)
+            else:
+                content = self._finish_slide_content(self._extract_json(text), slide_info)
             slides_content.append(content)
 
         self.slides_content = slides_content
@@ -404,6 +1239,25 @@ Respond with just the theme key (e.g., "modern_blue")"""
 
         return slides_content
 
+    def generate_content_via_batch(self) -> List[Dict]:
+        """
+        Generate content for all slides through the OpenAI Batch API
+
+        Submits one batch job and blocks until it finishes. Half the cost of
+        generate_content() and no rate-limit pressure, but the job can take
+        minutes to hours, so it only suits non-interactive runs.
+
+        Returns:
+            List of slide content dictionaries
+        """
+        print("\n  Generating content for all slides via the Batch API...")
+        return self.collect_content_batch(self.submit_content_batch())
+
+    def _print_content_progress(self, position: int, content: Dict) -> None:
+        """Print a progress line for one slide of a streamed content reply"""
+        title = content.get('title') or content.get('stat') or ''
+        print(f"\n  Slide {position + 1} content ready: {title}")
+
     def _generate_slide_content(self, slide_info: Dict) -> Dict:
         """
         Generate detailed content for a specific slide
@@ -414,6 +1268,15 @@ Respond with just the theme key (e.g., "modern_blue")"""
         Returns:
             Dict with detailed content (title, bullets, text, etc.)
         """
+        prompt = self._slide_content_prompt(slide_info)
+
+        reply = self._complete(prompt, temperature=0.7, response_format=JSON_RESPONSE_FORMAT)
+
+        content = self._extract_json(reply)
+        return self._finish_slide_content(content, slide_info)
+
+    def _slide_content_prompt(self, slide_info: Dict) -> str:
+        """Build the content generation prompt for an outline slide"""
         slide_type = slide_info['type']
 
         # Content generation prompt based on slide type
@@ -451,15 +1314,14 @@ Description: {slide_info['description']}
 Respond with JSON:
 {{"title": "Slide Title", "text": "Main content text for this slide"}}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7
-        )
+        return prompt
 
-        content = self._extract_json(response.choices[0].message.content)
+    def _finish_slide_content(self, content: Any, slide_info: Dict) -> Dict:
+        """Tag generated content with its slide number and type"""
+        if not isinstance(content, dict):
+            content = {}
         content['slide_number'] = slide_info['number']
-        content['slide_type'] = slide_type
+        content['slide_type'] = slide_info['type']
 
         return content
 
@@ -495,13 +1357,9 @@ Respond with JSON:
     "new_content": {{"title": "...", "bullets": [...]}} (if modifying content)
 }}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.5
-        )
+        reply = self._complete(prompt, temperature=0.5, response_format=JSON_RESPONSE_FORMAT)
 
-        action_plan = self._extract_json(response.choices[0].message.content)
+        action_plan = self._extract_json(reply)
 
         print(f"  Action: {action_plan.get('action', 'unknown')}")
         print(f"  Target slides: {action_plan.get('target_slides', [])}")
@@ -518,9 +1376,16 @@ Respond with JSON:
 
         elif action_plan.get('action') == 'change_theme':
             # Change presentation theme
-            new_theme = action_plan.get('new_theme', 'modern_blue')
+            new_theme = action_plan.get('new_theme', DEFAULT_THEME)
+            built_path = self._live_path
+            old_generator = self.ppt_generator
             self.select_theme(new_theme)
 
+            # Re-render an already built deck in the new theme from the
+            # content we have (no new API calls)
+            if built_path and self.ppt_generator is not old_generator and self.slides_content:
+                self.build_presentation(built_path)
+
         print("\n  Feedback applied successfully!")
 
     def self_review(self) -> Dict:
@@ -534,6 +1399,15 @@ Respond with JSON:
         print("STEP 5: Self-Review & Quality Check")
         print("="*70)
 
+        # Skip the request if nothing changed since the last review
+        review_key = hashlib.sha256(json.dumps(
+            [self.outline.get('presentation_title', ''), self.theme, self.slides_content],
+            sort_keys=True
+        ).encode("utf-8")).hexdigest()
+        if self._last_review and self._last_review[0] == review_key:
+            print("\n  Content unchanged since last review, reusing it")
+            return self._last_review[1]
+
         # AI reviews the complete presentation
         prompt = f"""Review this presentation for quality:
 
@@ -560,13 +1434,9 @@ Respond with JSON:
     "missing_topics": ["Topics that should be added"]
 }}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3
-        )
+        reply = self._complete(prompt, temperature=0.3, response_format=JSON_RESPONSE_FORMAT)
 
-        review = self._extract_json(response.choices[0].message.content)
+        review = self._extract_json(reply)
 
         print(f"\n  Quality: {review.get('overall_quality', 'N/A')}")
         print(f"  Score: {review.get('score', 0)}/100")
@@ -578,6 +1448,7 @@ Respond with JSON:
         for suggestion in review.get('suggestions', []):
             print(f"    - {suggestion}")
 
+        self._last_review = (review_key, review)
         return review
 
     def build_single_slide(self, slide_index: int, output_path: str) -> str:
@@ -602,28 +1473,32 @@ Respond with JSON:
         slide_content = self.slides_content[slide_index]
         slide_type = slide_content.get('slide_type', 'content')
 
-        # Map slide type to template layout
-        layout_key = self._map_slide_type_to_layout(slide_type)
-        template_idx = TemplatePPTGenerator.LAYOUT_MAP.get(layout_key, 2)
+        # Map slide type to template slide
+        template_idx = self._template_index_for(slide_type)
 
         # Copy template slide and populate with content
         self.ppt_generator.copy_slide(template_idx, slide_content)
         print(f"  Created slide {slide_content.get('slide_number', '?')}: {slide_content.get('title', 'Untitled')}")
 
         # Save presentation
-        saved_path = self.ppt_generator.save(output_path)
+        saved_path = self._save_deck(output_path)
 
         return saved_path
 
-    def modify_slide(self, slide_index: int, feedback: str, ppt_path: str) -> Dict:
+    def modify_slide(self, slide_index: int, feedback: str, ppt_path: str, flush: bool = True) -> Dict:
         """
         Modify a specific slide IN-PLACE based on user feedback
         (AutoGen agent modifies the PPTX slide directly)
 
+        When ppt_path is the deck this agent built, the slide is edited in
+        the presentation already in memory instead of re-opening the file.
+
         Args:
             slide_index: Index of slide to modify
             feedback: User feedback for this specific slide
             ppt_path: Path to PPTX file to modify
+            flush: Save the file now; pass False to batch several edits and
+                write them once with flush()
 
         Returns:
             Updated slide content
@@ -632,7 +1507,6 @@ Respond with JSON:
             return None
 
         old_content = self.slides_content[slide_index]
-        slide_info = self.outline['slides'][slide_index]
 
         # AutoGen agent interprets feedback and modifies content
         prompt = f"""You are an AutoGen conversational agent. Modify this slide content based on user feedback.
@@ -647,13 +1521,9 @@ If user wants to change title, return {{"title": "new title"}}.
 If user wants to add bullets, return {{"bullets": ["point 1", "point 2"]}}.
 Return only what changed."""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.5
-        )
+        reply = self._complete(prompt, temperature=0.5, response_format=JSON_RESPONSE_FORMAT)
 
-        changes = self._extract_json(response.choices[0].message.content)
+        changes = self._extract_json(reply)
 
         # Apply changes to existing content (in-place modification)
         old_content.update(changes)
@@ -661,21 +1531,49 @@ Return only what changed."""
         # Update in slides_content
         self.slides_content[slide_index] = old_content
 
-        # Rebuild ONLY this slide in the PPTX file
-        prs = Presentation(ppt_path)
+        # Rebuild ONLY this slide - in the live deck if it is the one at ppt_path
+        live = self.ppt_generator is not None and self._live_path == ppt_path
+        prs = self.ppt_generator.prs if live else Presentation(ppt_path)
         if slide_index < len(prs.slides):
             # Get the slide
             slide = prs.slides[slide_index]
 
-            # Modify the slide directly with updated content
-            self.ppt_generator._populate_slide_content(slide, old_content)
-
-            # Save the PPTX file
-            prs.save(ppt_path)
+            # Modify the slide directly with updated content (text shapes of
+            # live slides are already known from when they were built)
+            text_shapes = None
+            if live and slide_index < len(self.ppt_generator.slide_text_shapes):
+                text_shapes = self.ppt_generator.slide_text_shapes[slide_index]
+            self.ppt_generator._populate_slide_content(slide, old_content, text_shapes)
+
+            # Save the PPTX file (live edits can be batched until flush())
+            if not live:
+                _save_atomically(prs, ppt_path)
+            elif flush:
+                self._save_deck(ppt_path)
+            else:
+                self._unsaved_edits = True
             print(f"  Modified slide {slide_index + 1} in-place in {ppt_path}")
 
         return old_content
 
+    def flush(self) -> Optional[str]:
+        """
+        Write slide edits made with modify_slide(..., flush=False) to disk
+
+        Returns:
+            Path saved to, or None if there was nothing to save
+        """
+        if not self._unsaved_edits:
+            return None
+        return self._save_deck(self._live_path)
+
+    def _save_deck(self, output_path: str) -> str:
+        """Save the in-memory deck and remember it as the live copy of that file"""
+        saved_path = self.ppt_generator.save(output_path)
+        self._live_path = saved_path
+        self._unsaved_edits = False
+        return saved_path
+
     def build_presentation(self, output_path: str) -> str:
         """
         STEP 6: Build the final PowerPoint file
@@ -695,70 +1593,175 @@ Return only what changed."""
             return None
 
         # Create slides using template
+        slides = []
         for slide_content in self.slides_content:
             slide_type = slide_content.get('slide_type', 'content')
 
-            # Map slide type to template layout
-            layout_key = self._map_slide_type_to_layout(slide_type)
-            template_idx = TemplatePPTGenerator.LAYOUT_MAP.get(layout_key, 2)
+            # Map slide type to template slide
+            template_idx = self._template_index_for(slide_type)
+            slides.append((template_idx, slide_content))
 
-            # Copy template slide and populate with content
-            self.ppt_generator.copy_slide(template_idx, slide_content)
+        # Copy template slides and populate with content
+        self.ppt_generator.copy_slides(slides)
+        for _, slide_content in slides:
             print(f"  Created slide {slide_content.get('slide_number', '?')}: {slide_content.get('title', 'Untitled')}")
 
         # Save presentation
-        saved_path = self.ppt_generator.save(output_path)
+        saved_path = self._save_deck(output_path)
 
         print(f"\n  Presentation saved to: {saved_path}")
         print(f"  Total slides: {len(self.ppt_generator.prs.slides)}")
 
         return saved_path
 
-    def _map_slide_type_to_layout(self, slide_type: str) -> str:
-        """Map slide type from outline to template layout key"""
-        mapping = {
-            'title': 'title',
-            'content': 'content',
-            'bullets': 'bullets',
-            'stat': 'stat',
-            'statistics': 'stat',
-            'data': 'data',
-            'comparison': 'comparison',
-            'timeline': 'timeline',
-            'quote': 'quote',
-            'team': 'team',
-            'features': 'features',
-            'cta': 'cta',
-            'summary': 'bullets',
-            'conclusion': 'bullets'
-        }
-        return mapping.get(slide_type, 'content')
+    def generate_and_build(self, output_path: str) -> str:
+        """
+        STEPS 3 + 6 pipelined: build each slide while the rest are still streaming
+
+        Content comes from the single streamed request (generate_content_batched)
+        and every slide is copied into the deck as soon as its content
+        arrives, so building overlaps generation instead of waiting for it.
+        Slides must be added in order, so once a slide arrives incomplete the
+        remaining slides are built after it has been repaired.
+
+        Args:
+            output_path: Where to save the presentation
+
+        Returns:
+            Path to saved presentation
+        """
+        if not self.ppt_generator:
+            print("Error: No theme selected")
+            return None
+
+        outline_slides = self.outline.get('slides', [])
+        built = 0
+
+        def build_early(position: int, content: Dict) -> None:
+            nonlocal built
+            if position != built or position >= len(outline_slides):
+                return
+            slide_info = outline_slides[position]
+            if not self._is_complete_content(content, slide_info['type']):
+                return
+            self._build_slide(self._finish_slide_content(content, slide_info))
+            built += 1
+
+        self.generate_content_batched(on_slide=build_early)
+
+        # Anything not built while streaming (after a repaired slide)
+        for slide_content in self.slides_content[built:]:
+            self._build_slide(slide_content)
+
+        saved_path = self._save_deck(output_path)
+
+        print(f"\n  Presentation saved to: {saved_path}")
+        print(f"  Total slides: {len(self.ppt_generator.prs.slides)}")
+
+        return saved_path
+
+    def _build_slide(self, slide_content: Dict) -> None:
+        """Copy the matching template slide for one slide's content"""
+        template_idx = self._template_index_for(slide_content.get('slide_type', 'content'))
+        self.ppt_generator.copy_slide(template_idx, slide_content)
+        print(f"  Created slide {slide_content.get('slide_number', '?')}: {slide_content.get('title', 'Untitled')}")
+
+    async def build_presentation_async(self, output_path: str) -> str:
+        """
+        Build the final PowerPoint file without blocking the event loop
+
+        Slide assembly is CPU-bound python-pptx work, so it runs in the default
+        thread pool; an async web app can keep serving (or waiting on OpenAI
+        for another deck) while this one is assembled.
+
+        Args:
+            output_path: Where to save the presentation
+
+        Returns:
+            Path to saved presentation
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.build_presentation, output_path)
+
+    # Slide type from outline -> template layout key
+    SLIDE_TYPE_LAYOUTS = {
+        'title': 'title',
+        'content': 'content',
+        'bullets': 'bullets',
+        'stat': 'stat',
+        'statistics': 'stat',
+        'data': 'data',
+        'comparison': 'comparison',
+        'timeline': 'timeline',
+        'quote': 'quote',
+        'team': 'team',
+        'features': 'features',
+        'cta': 'cta',
+        'summary': 'bullets',
+        'conclusion': 'bullets'
+    }
+
+    # Slide type -> template slide index, resolved once from the two tables
+    SLIDE_TYPE_TEMPLATE_IDX = {
+        slide_type: TemplatePPTGenerator.LAYOUT_MAP[layout_key]
+        for slide_type, layout_key in SLIDE_TYPE_LAYOUTS.items()
+    }
+    DEFAULT_TEMPLATE_IDX = TemplatePPTGenerator.LAYOUT_MAP['content']
+
+    # Fields each slide type's content must have (matches _slide_content_prompt)
+    REQUIRED_CONTENT_FIELDS = {
+        'title': ('title',),
+        'content': ('title', 'bullets'),
+        'bullets': ('title', 'bullets'),
+        'stat': ('stat', 'description'),
+    }
+    DEFAULT_CONTENT_FIELDS = ('title', 'text')
+
+    def _is_complete_content(self, content: Any, slide_type: str) -> bool:
+        """Check generated content has every field its slide type needs"""
+        if not isinstance(content, dict):
+            return False
+        fields = self.REQUIRED_CONTENT_FIELDS.get(slide_type, self.DEFAULT_CONTENT_FIELDS)
+        return all(content.get(field) for field in fields)
+
+    def _template_index_for(self, slide_type: str) -> int:
+        """Map slide type from outline straight to its template slide index"""
+        return self.SLIDE_TYPE_TEMPLATE_IDX.get(slide_type, self.DEFAULT_TEMPLATE_IDX)
 
     def _extract_json(self, text: str) -> Any:
         """Extract JSON from AI response"""
         if not text:
             return {}
 
-        # Remove markdown code blocks
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
+        # Replies in JSON mode are bare JSON, so only search for a markdown
+        # code block when the reply doesn't already start like JSON
+        # (single regex pass, tolerates a missing closing fence)
+        if text.lstrip()[:1] not in ('{', '['):
+            match = _FENCE_RE.search(text)
+            if match:
+                text = match.group(1).strip()
 
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError as e:
             print(f"JSON parsing error: {e}")
             return {} if "{" in text else []
 
 
-def generate_presentation_interactive(topic: str, num_slides: int = 7) -> str:
+def generate_presentation_interactive(topic: str, num_slides: int = 7, interactive: bool = True,
+                                      do_review: bool = False, use_cache: bool = False) -> str:
     """
     Main function to generate presentation with conversational agent
 
     Args:
         topic: Presentation topic
         num_slides: Number of slides
+        interactive: If False, slide content is generated through the
+            (cheaper, slower) Batch API before the deck is built
+        do_review: Also run the AI self-review (only printed, so it's off
+            by default to save its large request)
+        use_cache: Reuse cached replies to identical earlier requests (see
+            ConversationalPPTAgent)
 
     Returns:
         Path to generated presentation
@@ -769,7 +1772,7 @@ def generate_presentation_interactive(topic: str, num_slides: int = 7) -> str:
     print("="*80)
 
     # Initialize agent
-    agent = ConversationalPPTAgent()
+    agent = ConversationalPPTAgent(use_cache=use_cache)
 
     # Step 1: Generate outline
     outline = agent.generate_outline(topic, num_slides)
@@ -777,19 +1780,23 @@ def generate_presentation_interactive(topic: str, num_slides: int = 7) -> str:
     # Step 2: Select theme
     theme = agent.select_theme()
 
-    # Step 3: Generate content
-    content = agent.generate_content()
-
-    # Step 4: Self-review
-    review = agent.self_review()
-
-    # Step 5: Build presentation
     import datetime
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_topic = "".join(c if c.isalnum() else "_" for c in topic[:30])
+    safe_topic = safe_filename(topic)
     output_path = f"output/{safe_topic}_{timestamp}.pptx"
 
-    final_path = agent.build_presentation(output_path)
+    if interactive:
+        # Steps 3 + 5: Generate content, building each slide as soon as it arrives
+        final_path = agent.generate_and_build(output_path)
+    else:
+        # Steps 3 + 5: Generate content as one batch job, then build
+        agent.generate_content_via_batch()
+        final_path = agent.build_presentation(output_path)
+    content = agent.slides_content
+
+    # Step 4: Self-review (only reports, so it can run after the build)
+    if do_review:
+        agent.self_review()
 
     print("\n" + "="*80)
     print("Presentation Complete!")
@@ -802,6 +1809,27 @@ def generate_presentation_interactive(topic: str, num_slides: int = 7) -> str:
     return final_path
 
 
+def generate_presentations(topics: List[str], num_slides: int = 7, max_concurrency: int = 4) -> List[str]:
+    """
+    Generate presentations for several topics concurrently
+
+    Each deck runs the full pipeline with its own agent. Almost all of the
+    time is spent waiting on OpenAI, so running decks side by side finishes
+    in roughly the time of the slowest deck instead of the sum of all.
+
+    Args:
+        topics: Presentation topics
+        num_slides: Number of slides per presentation
+        max_concurrency: Maximum decks generated at the same time (keeps
+            request rate within the API limits)
+
+    Returns:
+        Paths to generated presentations, in the same order as topics
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        return list(executor.map(lambda topic: generate_presentation_interactive(topic, num_slides), topics))
+
+
 if __name__ == "__main__":
     # Test the conversational agent
     test_topic = "Renewable Energy and Climate Change"
@@ -0,0 +1,44 @@
+"""
+Tests for the template-based slide generator in pptmaker_x
+"""
+
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+pytest.importorskip("pptx")
+
+from pptmaker_x import TemplatePPTGenerator  # noqa: E402
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    # Template paths are relative to the repository root
+    monkeypatch.chdir(REPO_ROOT)
+    return TemplatePPTGenerator('modern_blue')
+
+
+def _slide_texts(slide):
+    """Text of every text shape on a slide, top to bottom"""
+    shapes = sorted((s for s in slide.shapes if s.has_text_frame), key=lambda s: s.top)
+    return [s.text_frame.text for s in shapes]
+
+
+def test_control_characters_are_escaped(generator):
+    # Model JSON can contain escapes like \u0007; they must not break the XML
+    generator.copy_slide(2, {'title': 'bell\x07 here', 'bullets': ['x\x1by']})
+
+    texts = _slide_texts(generator.prs.slides[0])
+    assert texts[0] == 'bell_x0007_ here'
+    assert texts[1] == 'x_x001B_y'
+
+
+def test_line_breaks_stay_in_one_paragraph(generator):
+    generator.copy_slide(2, {'title': 'Title', 'bullets': ['first\nsecond', 'third']})
+
+    texts = _slide_texts(generator.prs.slides[0])
+    assert texts[1] == 'first\x0bsecond\nthird'